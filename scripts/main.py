@@ -1,6 +1,84 @@
 import json
+import mmap
+import os
+import pickle
+import sys
+from pathlib import Path
 
-with open("assets/models/bmw/bmw.gltf.json", "r") as f:
-    data = json.load(f)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-print(*[data["nodes"][i]["name"] for i in range(len(data["nodes"])) if "name" in data["nodes"][i]], sep="\n")
\ No newline at end of file
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def load_cached(path, parse, tag):
+    """Return parse(path), reusing a pickled sidecar while it is newer than the source"""
+    path = Path(path)
+    cache = path.with_suffix(f"{path.suffix}.{tag}.pkl")
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            return pickle.loads(cache.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError, IndexError, ValueError):
+            pass  # Unreadable or corrupt sidecar: treat it as a miss and rebuild
+
+    data = parse(path)
+
+    # Write to a temporary file first so an interrupted run never leaves a
+    # truncated sidecar behind
+    temp = cache.with_name(cache.name + ".tmp")
+    try:
+        temp.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(temp, cache)
+    except OSError:
+        # Caching is best-effort (e.g. read-only asset directory)
+        try:
+            temp.unlink()
+        except OSError:
+            pass
+    return data
+
+
+def parse_json(path):
+    """Parse a whole JSON file straight from a read-only memory map"""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if orjson is not None:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(mm[:])
+
+
+def read_node_names(path):
+    """Collect node names, streaming them with ijson instead of building the full tree"""
+    if ijson is not None:
+        names = []
+        has_nodes = False
+        with open(path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "nodes.item.name" and event == "string":
+                    names.append(value)
+                elif prefix == "nodes" and event == "start_array":
+                    has_nodes = True
+
+        # Match the full-parse path: a file without a node list is an error
+        if not has_nodes:
+            raise KeyError("nodes")
+        return names
+
+    nodes = parse_json(path)["nodes"]
+    return [node["name"] for node in nodes if "name" in node]
+
+
+def main():
+    """Print the node names of the BMW model"""
+    names = load_cached("assets/models/bmw/bmw.gltf.json", read_node_names, "names")
+    sys.stdout.write("".join(name + "\n" for name in names))
+
+
+if __name__ == "__main__":
+    main()
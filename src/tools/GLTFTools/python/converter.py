@@ -6,9 +6,12 @@ and extracts all relevant information to JSON format.
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 
 try:
     import pygltflib
@@ -17,13 +20,65 @@ except ImportError:
     print("Install with: pip install pygltflib")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# Number of iterencode() chunks the stdlib fallback joins per write
+_WRITE_BATCH = 4096
+
+
+def _encode_member(key: str, value: Any, pretty: bool = True) -> Iterator[Union[bytes, memoryview]]:
+    """Encode one `"key": value` member of a top-level JSON object, in pieces
+
+    The member is encoded as the object {key: value} without its outer
+    braces, so nested lines already carry the top-level indentation.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps({key: value}, option=orjson.OPT_INDENT_2 if pretty else 0)
+        yield memoryview(encoded)[1:-2 if pretty else -1]
+        return
+
+    if not pretty:
+        # Compact output goes through the much faster one-shot C encoder
+        yield memoryview(json.dumps({key: value}).encode('utf-8'))[1:-1]
+        return
+
+    # Indented output is streamed from iterencode() in batches. It opens with
+    # '{' and closes with '\n}', so each batch is held back until the next
+    # one shows it is not the last.
+    chunks = json.JSONEncoder(indent=2).iterencode({key: value})
+    next(chunks)
+    text = ''.join(islice(chunks, _WRITE_BATCH))
+    while True:
+        following = ''.join(islice(chunks, _WRITE_BATCH))
+        if not following:
+            break
+        yield text.encode('utf-8')
+        text = following
+
+    yield text[:-2].encode('utf-8')
+
+
+def _encode_document(sections: Iterator[Tuple[str, Any]], pretty: bool = True) -> Iterator[Union[bytes, memoryview]]:
+    """Encode a top-level JSON object from (key, value) sections, in pieces"""
+    separator = b'{'
+    for key, value in sections:
+        yield separator
+        yield from _encode_member(key, value, pretty)
+        separator = b','
+
+    yield b'\n}' if pretty else b'}'
+
 
 class GLTFConverter:
     """Convert GLTF/GLB files to comprehensive JSON representation"""
 
-    def __init__(self, input_path: str):
+    def __init__(self, input_path: str) -> None:
         self.input_path = Path(input_path)
-        self.gltf = None
+        self.gltf: Any = None
 
     def load(self) -> None:
         """Load GLTF or GLB file"""
@@ -38,11 +93,12 @@ class GLTFConverter:
 
     def extract_metadata(self) -> Dict[str, Any]:
         """Extract asset metadata"""
-        if not self.gltf or not self.gltf.asset:
+        gltf = self.gltf
+        if not gltf or not gltf.asset:
             return {}
 
-        asset = self.gltf.asset
-        metadata = {
+        asset = gltf.asset
+        metadata: Dict[str, Any] = {
             "version": asset.version,
         }
 
@@ -57,12 +113,13 @@ class GLTFConverter:
 
     def extract_scenes(self) -> List[Dict[str, Any]]:
         """Extract scene hierarchy"""
-        if not self.gltf or not self.gltf.scenes:
+        gltf = self.gltf
+        if not gltf or not gltf.scenes:
             return []
 
-        scenes = []
-        for idx, scene in enumerate(self.gltf.scenes):
-            scene_data = {
+        scenes: List[Dict[str, Any]] = []
+        for idx, scene in enumerate(gltf.scenes):
+            scene_data: Dict[str, Any] = {
                 "index": idx,
                 "nodes": scene.nodes if scene.nodes else []
             }
@@ -76,12 +133,14 @@ class GLTFConverter:
 
     def extract_nodes(self) -> List[Dict[str, Any]]:
         """Extract all nodes with transforms (TRS or matrix)"""
-        if not self.gltf or not self.gltf.nodes:
+        gltf = self.gltf
+        if not gltf or not gltf.nodes:
             return []
 
-        nodes = []
-        for idx, node in enumerate(self.gltf.nodes):
-            node_data = {
+        nodes: List[Dict[str, Any]] = []
+        append = nodes.append
+        for idx, node in enumerate(gltf.nodes):
+            node_data: Dict[str, Any] = {
                 "index": idx,
             }
 
@@ -114,18 +173,52 @@ class GLTFConverter:
             if node.scale:
                 node_data["scale"] = node.scale
 
-            nodes.append(node_data)
+            append(node_data)
 
         return nodes
 
+    def extract_nodes_linear(self) -> Dict[str, List[Any]]:
+        """Extract the node hierarchy as parallel arrays (parent, first child, next sibling)
+
+        Missing links are -1, so consumers can walk the hierarchy with flat
+        index lookups instead of chasing children lists. Child indices that
+        do not name a node are left out of the links.
+        """
+        gltf = self.gltf
+        nodes = gltf.nodes if gltf and gltf.nodes else []
+        count = len(nodes)
+        parent = [-1] * count
+        first_child = [-1] * count
+        next_sibling = [-1] * count
+
+        for idx, node in enumerate(nodes):
+            children = [child for child in node.children or () if 0 <= child < count]
+            if not children:
+                continue
+
+            first_child[idx] = children[0]
+            for child, sibling in zip(children, children[1:]):
+                next_sibling[child] = sibling
+            for child in children:
+                parent[child] = idx
+
+        return {
+            "parent": parent,
+            "firstChild": first_child,
+            "nextSibling": next_sibling,
+            "name": [node.name or "" for node in nodes],
+        }
+
     def extract_meshes(self) -> List[Dict[str, Any]]:
         """Extract mesh geometry information (primitive counts, attributes)"""
-        if not self.gltf or not self.gltf.meshes:
+        gltf = self.gltf
+        if not gltf or not gltf.meshes:
             return []
 
-        meshes = []
-        for idx, mesh in enumerate(self.gltf.meshes):
-            mesh_data = {
+        accessors = gltf.accessors
+        meshes: List[Dict[str, Any]] = []
+        for idx, mesh in enumerate(gltf.meshes):
+            mesh_data: Dict[str, Any] = {
                 "index": idx,
                 "primitives": []
             }
@@ -138,7 +231,7 @@ class GLTFConverter:
 
             # Extract primitives
             for prim_idx, prim in enumerate(mesh.primitives):
-                prim_data = {
+                prim_data: Dict[str, Any] = {
                     "index": prim_idx,
                     "mode": prim.mode if prim.mode is not None else 4,  # Default TRIANGLES
                     "attributes": {}
@@ -148,37 +241,38 @@ class GLTFConverter:
                     prim_data["material"] = prim.material
 
                 # Extract attribute accessors
-                if prim.attributes.POSITION is not None:
-                    accessor = self.gltf.accessors[prim.attributes.POSITION]
+                attributes = prim.attributes
+                if attributes.POSITION is not None:
+                    accessor = accessors[attributes.POSITION]
                     prim_data["attributes"]["POSITION"] = {
-                        "accessor": prim.attributes.POSITION,
+                        "accessor": attributes.POSITION,
                         "count": accessor.count,
                         "type": accessor.type,
                         "componentType": accessor.componentType
                     }
 
-                if prim.attributes.NORMAL is not None:
-                    accessor = self.gltf.accessors[prim.attributes.NORMAL]
+                if attributes.NORMAL is not None:
+                    accessor = accessors[attributes.NORMAL]
                     prim_data["attributes"]["NORMAL"] = {
-                        "accessor": prim.attributes.NORMAL,
+                        "accessor": attributes.NORMAL,
                         "count": accessor.count,
                         "type": accessor.type,
                         "componentType": accessor.componentType
                     }
 
-                if prim.attributes.TEXCOORD_0 is not None:
-                    accessor = self.gltf.accessors[prim.attributes.TEXCOORD_0]
+                if attributes.TEXCOORD_0 is not None:
+                    accessor = accessors[attributes.TEXCOORD_0]
                     prim_data["attributes"]["TEXCOORD_0"] = {
-                        "accessor": prim.attributes.TEXCOORD_0,
+                        "accessor": attributes.TEXCOORD_0,
                         "count": accessor.count,
                         "type": accessor.type,
                         "componentType": accessor.componentType
                     }
 
-                if prim.attributes.COLOR_0 is not None:
-                    accessor = self.gltf.accessors[prim.attributes.COLOR_0]
+                if attributes.COLOR_0 is not None:
+                    accessor = accessors[attributes.COLOR_0]
                     prim_data["attributes"]["COLOR_0"] = {
-                        "accessor": prim.attributes.COLOR_0,
+                        "accessor": attributes.COLOR_0,
                         "count": accessor.count,
                         "type": accessor.type,
                         "componentType": accessor.componentType
@@ -186,7 +280,7 @@ class GLTFConverter:
 
                 # Extract indices
                 if prim.indices is not None:
-                    indices_accessor = self.gltf.accessors[prim.indices]
+                    indices_accessor = accessors[prim.indices]
                     prim_data["indices"] = {
                         "accessor": prim.indices,
                         "count": indices_accessor.count,
@@ -202,12 +296,13 @@ class GLTFConverter:
 
     def extract_materials(self) -> List[Dict[str, Any]]:
         """Extract PBR material properties (baseColor, metallic, roughness, textures)"""
-        if not self.gltf or not self.gltf.materials:
+        gltf = self.gltf
+        if not gltf or not gltf.materials:
             return []
 
-        materials = []
-        for idx, mat in enumerate(self.gltf.materials):
-            mat_data = {
+        materials: List[Dict[str, Any]] = []
+        for idx, mat in enumerate(gltf.materials):
+            mat_data: Dict[str, Any] = {
                 "index": idx,
             }
 
@@ -274,12 +369,13 @@ class GLTFConverter:
 
     def extract_textures(self) -> List[Dict[str, Any]]:
         """Extract texture information"""
-        if not self.gltf or not self.gltf.textures:
+        gltf = self.gltf
+        if not gltf or not gltf.textures:
             return []
 
-        textures = []
-        for idx, tex in enumerate(self.gltf.textures):
-            tex_data = {
+        textures: List[Dict[str, Any]] = []
+        for idx, tex in enumerate(gltf.textures):
+            tex_data: Dict[str, Any] = {
                 "index": idx,
             }
 
@@ -298,12 +394,13 @@ class GLTFConverter:
 
     def extract_images(self) -> List[Dict[str, Any]]:
         """Extract image information"""
-        if not self.gltf or not self.gltf.images:
+        gltf = self.gltf
+        if not gltf or not gltf.images:
             return []
 
-        images = []
-        for idx, img in enumerate(self.gltf.images):
-            img_data = {
+        images: List[Dict[str, Any]] = []
+        for idx, img in enumerate(gltf.images):
+            img_data: Dict[str, Any] = {
                 "index": idx,
             }
 
@@ -325,12 +422,13 @@ class GLTFConverter:
 
     def extract_buffers(self) -> List[Dict[str, Any]]:
         """Extract buffer metadata (sizes, URIs, not full binary data)"""
-        if not self.gltf or not self.gltf.buffers:
+        gltf = self.gltf
+        if not gltf or not gltf.buffers:
             return []
 
-        buffers = []
-        for idx, buf in enumerate(self.gltf.buffers):
-            buf_data = {
+        buffers: List[Dict[str, Any]] = []
+        for idx, buf in enumerate(gltf.buffers):
+            buf_data: Dict[str, Any] = {
                 "index": idx,
                 "byteLength": buf.byteLength
             }
@@ -347,12 +445,14 @@ class GLTFConverter:
 
     def extract_accessors(self) -> List[Dict[str, Any]]:
         """Extract accessor information"""
-        if not self.gltf or not self.gltf.accessors:
+        gltf = self.gltf
+        if not gltf or not gltf.accessors:
             return []
 
-        accessors = []
-        for idx, acc in enumerate(self.gltf.accessors):
-            acc_data = {
+        accessors: List[Dict[str, Any]] = []
+        append = accessors.append
+        for idx, acc in enumerate(gltf.accessors):
+            acc_data: Dict[str, Any] = {
                 "index": idx,
                 "componentType": acc.componentType,
                 "count": acc.count,
@@ -377,90 +477,133 @@ class GLTFConverter:
             if acc.name:
                 acc_data["name"] = acc.name
 
-            accessors.append(acc_data)
+            append(acc_data)
 
         return accessors
 
-    def convert_to_json(self, include_accessors: bool = True) -> Dict[str, Any]:
-        """Generate comprehensive JSON representation"""
-        print("Extracting GLTF data...")
-
-        json_data = {
-            "asset": self.extract_metadata(),
-            "scenes": self.extract_scenes(),
-            "nodes": self.extract_nodes(),
-            "meshes": self.extract_meshes(),
-            "materials": self.extract_materials(),
-            "textures": self.extract_textures(),
-            "images": self.extract_images(),
-            "buffers": self.extract_buffers(),
-        }
+    def iter_sections(self, include_accessors: bool = True) -> Iterator[Tuple[str, Any]]:
+        """Yield (key, data) for each top-level JSON section, extracting lazily"""
+        yield "asset", self.extract_metadata()
+        yield "scenes", self.extract_scenes()
+        yield "nodes", self.extract_nodes()
+        yield "nodesLinear", self.extract_nodes_linear()
+        yield "meshes", self.extract_meshes()
+        yield "materials", self.extract_materials()
+        yield "textures", self.extract_textures()
+        yield "images", self.extract_images()
+        yield "buffers", self.extract_buffers()
 
         if include_accessors:
-            json_data["accessors"] = self.extract_accessors()
+            yield "accessors", self.extract_accessors()
 
         # Add extensions if present
         if self.gltf.extensionsUsed:
-            json_data["extensionsUsed"] = self.gltf.extensionsUsed
+            yield "extensionsUsed", self.gltf.extensionsUsed
 
         if self.gltf.extensionsRequired:
-            json_data["extensionsRequired"] = self.gltf.extensionsRequired
+            yield "extensionsRequired", self.gltf.extensionsRequired
+
+    def convert_to_json(self, include_accessors: bool = True) -> Dict[str, Any]:
+        """Generate comprehensive JSON representation"""
+        print("Extracting GLTF data...")
+
+        json_data = dict(self.iter_sections(include_accessors))
 
         print("✓ Extraction complete")
         return json_data
 
     def save_json(self, output_path: str, pretty: bool = True) -> None:
-        """Save to JSON file"""
-        json_data = self.convert_to_json()
-
+        """Save to JSON file, encoding one top-level section at a time"""
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w') as f:
-            if pretty:
-                json.dump(json_data, f, indent=2)
-            else:
-                json.dump(json_data, f)
+        print("Extracting GLTF data...")
 
+        # Sections are extracted and encoded one at a time. Writes run on a
+        # background thread (file I/O releases the GIL) so the next section
+        # is extracted while the previous one is written.
+        # Everything goes to a temporary file that replaces the output only
+        # once it is complete, so a failed extraction never leaves a
+        # truncated file (or destroys a previous good one).
+        temp_file = output_file.with_name(output_file.name + '.tmp')
+        try:
+            with open(temp_file, 'wb') as f, ThreadPoolExecutor(max_workers=1) as writer:
+                pending = None
+                for piece in _encode_document(self.iter_sections(), pretty):
+                    if pending is not None:
+                        pending.result()
+                    pending = writer.submit(f.write, piece)
+
+                if pending is not None:
+                    pending.result()
+
+            os.replace(temp_file, output_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        print("✓ Extraction complete")
         print(f"✓ Saved JSON to: {output_file}")
         print(f"  File size: {output_file.stat().st_size:,} bytes")
 
     @staticmethod
-    def convert_file(input_path: str, output_path: str, pretty: bool = True) -> None:
-        """Convenience method for one-shot conversion"""
+    def convert_file(input_path: str, output_path: str, pretty: bool = True, force: bool = False) -> bool:
+        """Convenience method for one-shot conversion
+
+        Skips the conversion when output_path is newer than input_path unless
+        force is set. Returns True if the file was converted.
+        """
+        source = Path(input_path)
+        output = Path(output_path)
+        if not force and output.exists() and output.stat().st_mtime >= source.stat().st_mtime:
+            print(f"✓ Output is up to date: {output} (use --force to regenerate)")
+            return False
+
         converter = GLTFConverter(input_path)
         converter.load()
         converter.save_json(output_path, pretty=pretty)
+        return True
+
+
+USAGE = """GLTF/GLB to JSON Converter
+
+Usage:
+  python converter.py <input.glb> [output.json] [--force]
+
+Options:
+  --force    Convert even if the output is newer than the input
 
+Examples:
+  python converter.py model.glb
+  python converter.py model.glb output.json
+  python converter.py model.gltf model_data.json --force
 
-def main():
+"""
+
+
+def main() -> None:
     """CLI entry point"""
-    if len(sys.argv) < 2:
-        print("GLTF/GLB to JSON Converter")
-        print("")
-        print("Usage:")
-        print("  python converter.py <input.glb> [output.json]")
-        print("")
-        print("Examples:")
-        print("  python converter.py model.glb")
-        print("  python converter.py model.glb output.json")
-        print("  python converter.py model.gltf model_data.json")
-        print("")
+    args = sys.argv[1:]
+    force = '--force' in args
+    args = [arg for arg in args if arg != '--force']
+
+    if len(args) < 1:
+        sys.stdout.write(USAGE)
         sys.exit(1)
 
-    input_file = sys.argv[1]
+    input_file = args[0]
 
-    if len(sys.argv) >= 3:
-        output_file = sys.argv[2]
+    if len(args) >= 2:
+        output_file = args[1]
     else:
         # Auto-generate output filename
         input_path = Path(input_file)
         output_file = str(input_path.with_suffix('.json'))
 
     try:
-        GLTFConverter.convert_file(input_file, output_file)
-        print("")
-        print("✓ Conversion successful!")
+        if GLTFConverter.convert_file(input_file, output_file, force=force):
+            print("")
+            print("✓ Conversion successful!")
 
     except FileNotFoundError:
         print(f"Error: Input file not found: {input_file}")